@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import stat
+import struct
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+
+from .config import EXCLUDED_DIR_NAMES
+
+# Constants from <sys/attr.h> and <sys/vnode.h>.
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_CRTIME = 0x00000200
+ATTR_CMN_MODTIME = 0x00000400
+ATTR_CMN_FLAGS = 0x00040000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+FSOPT_NOFOLLOW = 0x00000001
+FSOPT_PACK_INVAL_ATTRS = 0x00000008
+VDIR = 2
+VLNK = 5
+
+ATTRLIST_BUFFER_SIZE = 64 * 1024
+
+# Packed entry layout: u32 length, attribute_set_t (five u32s), the name's
+# attrreference_t, u32 object type, crtime and modtime as timespecs, then the
+# u32 BSD flags. Attributes are only 4-byte aligned, hence the "=" formats.
+ENTRY_HEADER = struct.Struct("=I5I")
+NAME_REFERENCE = struct.Struct("=iI")
+OBJTYPE_TIMES_AND_FLAGS = struct.Struct("=IqqqqI")
+
+
+class AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+@lru_cache(maxsize=1)
+def getattrlistbulk_function() -> Callable[..., int] | None:
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        function = libc.getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+    function.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(AttrList),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint64,
+    ]
+    function.restype = ctypes.c_int
+    return function
+
+
+def list_directory_bulk(
+    path: str, modified_since: float | None = None
+) -> tuple[list[tuple[str, float]], list[str]] | None:
+    # One getattrlistbulk call returns names, types and creation times for a
+    # whole batch of entries, where scandir + stat costs a syscall per file.
+    # None means the call is unavailable here and the caller should scandir.
+    getattrlistbulk = getattrlistbulk_function()
+    if getattrlistbulk is None:
+        return None
+
+    attributes = AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=ATTR_CMN_RETURNED_ATTRS
+        | ATTR_CMN_NAME
+        | ATTR_CMN_OBJTYPE
+        | ATTR_CMN_CRTIME
+        | ATTR_CMN_MODTIME
+        | ATTR_CMN_FLAGS,
+    )
+    buffer = ctypes.create_string_buffer(ATTRLIST_BUFFER_SIZE)
+    view = memoryview(buffer).cast("B")
+    files: list[tuple[str, float]] = []
+    subdirectories: list[str] = []
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+    try:
+        # See list_directory: an unchanged directory only contributes its
+        # subdirectories.
+        include_files = (
+            modified_since is None or os.fstat(fd).st_mtime >= modified_since
+        )
+        while True:
+            count = getattrlistbulk(
+                fd,
+                ctypes.byref(attributes),
+                buffer,
+                ATTRLIST_BUFFER_SIZE,
+                FSOPT_NOFOLLOW | FSOPT_PACK_INVAL_ATTRS,
+            )
+            if count < 0:
+                return None
+            if count == 0:
+                break
+
+            offset = 0
+            for _ in range(count):
+                length, returned_common, *_ = ENTRY_HEADER.unpack_from(view, offset)
+                name_field = offset + ENTRY_HEADER.size
+                name_offset, name_length = NAME_REFERENCE.unpack_from(view, name_field)
+                name_start = name_field + name_offset
+                # attr_length counts the trailing NUL.
+                name = os.fsdecode(
+                    bytes(view[name_start : name_start + name_length - 1])
+                )
+                (
+                    objtype,
+                    crtime_sec,
+                    crtime_nsec,
+                    mtime_sec,
+                    mtime_nsec,
+                    flags,
+                ) = OBJTYPE_TIMES_AND_FLAGS.unpack_from(
+                    view, name_field + NAME_REFERENCE.size
+                )
+                offset += length
+
+                if name.startswith("."):
+                    continue
+                entry_path = os.path.join(path, name)
+                if objtype == VDIR:
+                    if name not in EXCLUDED_DIR_NAMES and not flags & stat.UF_HIDDEN:
+                        subdirectories.append(entry_path)
+                elif not include_files:
+                    continue
+                elif objtype == VLNK:
+                    # Match scandir: follow links to files, never into dirs.
+                    try:
+                        target = os.stat(entry_path)
+                    except OSError:
+                        continue
+                    if not stat.S_ISDIR(target.st_mode):
+                        files.append(
+                            (
+                                entry_path,
+                                getattr(target, "st_birthtime", target.st_mtime),
+                            )
+                        )
+                elif returned_common & ATTR_CMN_CRTIME:
+                    files.append((entry_path, crtime_sec + crtime_nsec / 1e9))
+                else:
+                    files.append((entry_path, mtime_sec + mtime_nsec / 1e9))
+    finally:
+        os.close(fd)
+
+    return files, subdirectories
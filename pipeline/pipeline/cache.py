@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from .config import DEFAULT_CACHE_DIR
+
+
+def cache_path(name: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    return cache_dir / name
+
+
+def read_json_cache(
+    name: str,
+    max_age: timedelta | None = None,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> dict[str, Any] | None:
+    path = cache_path(name, cache_dir)
+    try:
+        if max_age is not None:
+            age_seconds = time.time() - path.stat().st_mtime
+            if age_seconds > max_age.total_seconds():
+                return None
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    return payload
+
+
+def write_json_cache(
+    name: str,
+    payload: dict[str, Any],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> None:
+    path = cache_path(name, cache_dir)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caches only save work on later runs; failing to persist one should
+        # never fail the pipeline itself.
+        tmp_path.unlink(missing_ok=True)
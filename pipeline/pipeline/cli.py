@@ -5,20 +5,24 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 import click
-from rich.console import Console
+from rich import get_console
+from rich.markup import escape
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 from .config import (
     DEFAULT_AUDIOHIJACK_PATH,
+    DEFAULT_FFMPEG_PARALLELISM,
+    DEFAULT_FRAMEIO_WORKERS,
     DEFAULT_PODCAST_ROOT,
     DEFAULT_START_WINDOW,
     FRAMEIO_VAULT_ENTRY,
     FRAMEIO_VAULT_NAME,
+    TOGGLE_INDEX_PATTERN,
     load_frameio_settings,
     parse_duration,
 )
-from .frame import upload_episode_files_to_frameio
+from .frame import convert_and_upload_episode_files
 from .resource import (
     EpisodeGroup,
     MediaGroup,
@@ -26,39 +30,58 @@ from .resource import (
     convert_mov_files,
     discover_sources,
     find_existing_episode_numbers,
+    find_existing_source_paths,
     group_files_by_start_time,
+    load_scan_cache,
     move_groups_to_episodes,
+    save_scan_cache,
+    scan_cache_key,
     scan_sources_for_today_files,
 )
 
-console = Console()
+console = get_console()
 
 
 def parse_toggle_indices(raw: str, max_index: int) -> set[int]:
     indices: set[int] = set()
     for token in raw.split(","):
-        token = token.strip()
-        if not token:
-            continue
-        value = int(token)
-        if value < 1 or value > max_index:
-            raise ValueError(f"Index {value} is out of range 1..{max_index}.")
-        indices.add(value)
+        match = TOGGLE_INDEX_PATTERN.fullmatch(token)
+        if match is None:
+            raise ValueError(f"Invalid index '{token.strip()}'.")
+        if match.group(1):
+            indices.add(int(match.group(1)))
+
+    out_of_range = sorted(value for value in indices if value < 1 or value > max_index)
+    if out_of_range:
+        raise ValueError(f"Index {out_of_range[0]} is out of range 1..{max_index}.")
     return indices
 
 
-def prompt_for_sources(options: list[SourceOption]) -> list[SourceOption]:
-    while True:
-        console.print(
-            "\nSelectable sources (toggle with comma-separated indices):", style="bold"
+def print_source_table(options: list[SourceOption], existing_paths: set[Path]) -> None:
+    table = Table(title="Selectable sources (toggle with comma-separated indices)")
+    table.add_column("#", justify="right")
+    table.add_column("Selected", justify="center")
+    table.add_column("Name")
+    table.add_column("Path")
+    table.add_column("Status")
+
+    for index, option in enumerate(options, start=1):
+        table.add_row(
+            str(index),
+            "x" if option.selected else "",
+            escape(option.name),
+            escape(str(option.path)),
+            "" if option.path in existing_paths else "missing path",
         )
-        for index, option in enumerate(options, start=1):
-            checked = "x" if option.selected else " "
-            availability = "" if option.path.exists() else " (missing path)"
-            console.print(
-                f"{index:>2}. [{checked}] {option.name}: {option.path}{availability}",
-                markup=False,
-            )
+
+    console.print(table)
+
+
+def prompt_for_sources(
+    options: list[SourceOption], existing_paths: set[Path]
+) -> list[SourceOption]:
+    while True:
+        print_source_table(options, existing_paths)
 
         raw = Prompt.ask(
             "Toggle sources, or press Enter to continue with current selection",
@@ -83,10 +106,12 @@ def prompt_for_sources(options: list[SourceOption]) -> list[SourceOption]:
             options[index - 1].selected = not options[index - 1].selected
 
 
-def normalize_selected_sources(sources: list[SourceOption]) -> list[SourceOption]:
+def normalize_selected_sources(
+    sources: list[SourceOption], existing_paths: set[Path]
+) -> list[SourceOption]:
     valid_sources: list[SourceOption] = []
     for source in sources:
-        if source.path.exists():
+        if source.path in existing_paths:
             valid_sources.append(source)
         else:
             console.print(
@@ -129,6 +154,12 @@ def run(
     yes: bool,
     dry_run: bool,
     skip_frameio_upload: bool,
+    frameio_workers: int,
+    ffmpeg_parallelism: int,
+    hwaccel: bool,
+    fragmented_mp4: bool,
+    prune: bool,
+    resume: bool,
 ) -> int:
     try:
         frameio_settings = load_frameio_settings()
@@ -143,6 +174,9 @@ def run(
     )
 
     source_options = discover_sources(audiohijack_path)
+    # Check availability once up front; the picker re-renders on every toggle
+    # and should not stat each source again.
+    existing_paths = find_existing_source_paths(source_options)
     if all_volumes:
         for option in source_options:
             option.selected = True
@@ -150,9 +184,9 @@ def run(
     if yes or not sys.stdin.isatty():
         selected_sources = [option for option in source_options if option.selected]
     else:
-        selected_sources = prompt_for_sources(source_options)
+        selected_sources = prompt_for_sources(source_options, existing_paths)
 
-    selected_sources = normalize_selected_sources(selected_sources)
+    selected_sources = normalize_selected_sources(selected_sources, existing_paths)
     if not selected_sources:
         console.print("No valid source paths selected.", style="bold red")
         return 1
@@ -162,7 +196,18 @@ def run(
     day_end = day_start + timedelta(days=1)
     console.print(f"Finding files created on {day_start:%Y-%m-%d}...")
 
-    scanned_files = scan_sources_for_today_files(selected_sources, day_start, day_end)
+    cache_key = scan_cache_key(selected_sources, day_start, day_end, prune)
+    scanned_files = None
+    if cache_key is not None and resume:
+        scanned_files = load_scan_cache(cache_key)
+    if scanned_files is not None:
+        console.print(f"Resuming from cached scan ({len(scanned_files)} file(s)).")
+    else:
+        scanned_files, complete = scan_sources_for_today_files(
+            selected_sources, day_start, day_end, prune=prune
+        )
+        if cache_key is not None and complete:
+            save_scan_cache(cache_key, scanned_files)
     if not scanned_files:
         console.print("No files created today were found in selected sources.")
         return 0
@@ -204,18 +249,28 @@ def run(
         console.print("Dry run complete. No files were moved or converted.")
         return 0
 
-    convert_code = convert_mov_files(episode_groups, dry_run=False)
-    if convert_code != 0:
-        return convert_code
-
     if skip_frameio_upload:
+        convert_code = convert_mov_files(
+            episode_groups,
+            dry_run=False,
+            parallelism=ffmpeg_parallelism,
+            hwaccel=hwaccel,
+            fragmented=fragmented_mp4,
+        )
+        if convert_code != 0:
+            return convert_code
+
         console.print("Skipping Frame.io upload (--skip-frameio-upload).")
         return 0
 
-    return upload_episode_files_to_frameio(
+    return convert_and_upload_episode_files(
         episode_groups,
         token=frameio_settings.token.get_secret_value(),
         destination_id=frameio_settings.destination_id,
+        workers=frameio_workers,
+        ffmpeg_parallelism=ffmpeg_parallelism,
+        hwaccel=hwaccel,
+        fragmented=fragmented_mp4,
     )
 
 
@@ -264,6 +319,42 @@ def run(
     is_flag=True,
     help="Skip uploading audio and .mp4 files to Frame.io after conversion.",
 )
+@click.option(
+    "--frameio-workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FRAMEIO_WORKERS,
+    show_default=True,
+    help="Number of files uploaded to Frame.io concurrently.",
+)
+@click.option(
+    "--ffmpeg-parallelism",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FFMPEG_PARALLELISM,
+    envvar="PODCAST_FFMPEG_PARALLEL",
+    show_default=True,
+    show_envvar=True,
+    help="Number of ffmpeg conversions run concurrently (one per VideoToolbox engine).",
+)
+@click.option(
+    "--no-hwaccel",
+    is_flag=True,
+    help="Decode .mov files in software instead of with VideoToolbox.",
+)
+@click.option(
+    "--fragmented-mp4",
+    is_flag=True,
+    help="Write fragmented _HQ.mp4 files instead of rewriting them for faststart.",
+)
+@click.option(
+    "--no-prune",
+    is_flag=True,
+    help="Check every file while scanning, even in directories unchanged since today.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Reuse today's cached scan instead of walking the sources again.",
+)
 def cli(
     start_window: timedelta,
     podcast_root: Path,
@@ -272,6 +363,12 @@ def cli(
     yes: bool,
     dry_run: bool,
     skip_frameio_upload: bool,
+    frameio_workers: int,
+    ffmpeg_parallelism: int,
+    no_hwaccel: bool,
+    fragmented_mp4: bool,
+    no_prune: bool,
+    resume: bool,
 ) -> int:
     return run(
         start_window=start_window,
@@ -281,6 +378,12 @@ def cli(
         yes=yes,
         dry_run=dry_run,
         skip_frameio_upload=skip_frameio_upload,
+        frameio_workers=frameio_workers,
+        ffmpeg_parallelism=ffmpeg_parallelism,
+        hwaccel=not no_hwaccel,
+        fragmented_mp4=fragmented_mp4,
+        prune=not no_prune,
+        resume=resume,
     )
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import SecretStr, ValidationError
@@ -11,12 +12,79 @@ from vaultdantic import OnePasswordConfigDict, VaultMixin
 DEFAULT_START_WINDOW = "5min"
 DEFAULT_PODCAST_ROOT = Path("/Volumes/Common_Drive/podcast")
 DEFAULT_AUDIOHIJACK_PATH = Path("/Users/piercefreeman/Music/Audio Hijack")
+DEFAULT_VOLUMES_ROOT = Path("/Volumes")
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "podcast-pipeline"
+DEFAULT_FRAMEIO_WORKERS = 4
+DEFAULT_SCAN_WORKERS = 16
+DEFAULT_SOURCE_SCAN_WORKERS = 8
+DEFAULT_MOVE_WORKERS = 8
+# Concurrent moves per storage class: solid-state disks keep up with many
+# parallel copies, while spinning disks slow down once reads start seeking.
+SSD_MOVE_WORKERS = 16
+HDD_MOVE_WORKERS = 2
+# Network shares serialize requests on one connection, so parallel moves only
+# queue up behind each other on the server.
+NETWORK_MOVE_WORKERS = 1
+NETWORK_FILESYSTEM_TYPES = frozenset(
+    {
+        "9p",
+        "afpfs",
+        "cifs",
+        "fuse.sshfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+        "webdav",
+    }
+)
+# Camera and recorder firmware writing to FAT/exFAT cards often leaves the
+# directory timestamp alone when adding clips, so directory mtimes there
+# can't be used to prune the scan.
+UNRELIABLE_DIRECTORY_MTIME_FILESYSTEMS = frozenset({"exfat", "msdos", "vfat"})
+# Directory names never worth descending into while looking for recordings.
+# Dot-directories (.Trashes, .Spotlight-V100, .git, ...) are skipped anyway.
+EXCLUDED_DIR_NAMES = frozenset(
+    {
+        "$RECYCLE.BIN",
+        "Applications",
+        "Library",
+        "System Volume Information",
+        "lost+found",
+        "node_modules",
+    }
+)
+# Apple Silicon has two VideoToolbox media engines; more concurrent
+# hevc_videotoolbox sessions only queue for them while each holds another
+# full-resolution decode in memory.
+DEFAULT_FFMPEG_PARALLELISM = 2
+FFMPEG_LOG_BATCH_LINES = 64
+FFMPEG_LOG_FLUSH_SECONDS = 0.25
+FFMPEG_PROGRESS_SUMMARY_FIELDS = ("frame", "fps", "out_time", "bitrate", "speed")
 
 EPISODE_PATTERN = re.compile(r"^episode_(\d+)$")
+TOGGLE_INDEX_PATTERN = re.compile(r"\s*(\d*)\s*")
 WINDOW_PATTERN = re.compile(
     r"^\s*(\d+)\s*(s|sec|secs|second|seconds|m|min|mins|minute|minutes|h|hr|hrs|hour|hours)\s*$",
     re.IGNORECASE,
 )
+WINDOW_UNITS = {
+    "s": "seconds",
+    "sec": "seconds",
+    "secs": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+    "m": "minutes",
+    "min": "minutes",
+    "mins": "minutes",
+    "minute": "minutes",
+    "minutes": "minutes",
+    "h": "hours",
+    "hr": "hours",
+    "hrs": "hours",
+    "hour": "hours",
+    "hours": "hours",
+}
 
 AUDIO_EXTENSIONS = {
     ".aac",
@@ -32,6 +100,20 @@ AUDIO_EXTENSIONS = {
     ".wma",
 }
 VIDEO_UPLOAD_EXTENSIONS = {".mp4"}
+UPLOAD_EXTENSIONS = frozenset(AUDIO_EXTENSIONS | VIDEO_UPLOAD_EXTENSIONS)
+
+SCAN_CACHE_FILE = "scan.json"
+SCAN_CACHE_TTL = timedelta(hours=6)
+EPISODE_INDEX_CACHE_FILE = "episodes.json"
+# HFS+, exFAT and many SMB servers store mtimes at 1-2s granularity, so a
+# folder created right after listing the root may leave its mtime unchanged.
+# Index entries this fresh aren't persisted.
+EPISODE_INDEX_RACY_SECONDS = 2
+FRAMEIO_DESTINATION_CACHE_FILE = "frameio.json"
+FRAMEIO_DESTINATION_CACHE_TTL = timedelta(hours=24)
+FRAMEIO_UPLOAD_PART_WORKERS = 2
+FRAMEIO_UPLOAD_MAX_RETRIES = 4
+FRAMEIO_UPLOAD_RETRY_BACKOFF_SECONDS = 1.0
 
 FRAMEIO_VAULT_NAME = "Side-Projects"
 FRAMEIO_VAULT_ENTRY = "Pretrained-Pipeline"
@@ -53,6 +135,9 @@ class FrameioSettings(BaseSettings, VaultMixin):
     destination_id: str
 
 
+# Reading settings may round-trip to the 1Password vault, so keep the result
+# for the life of the process.
+@lru_cache(maxsize=1)
 def load_frameio_settings() -> FrameioSettings:
     try:
         return FrameioSettings()
@@ -79,9 +164,5 @@ def parse_duration(window: str) -> timedelta:
         )
 
     amount = int(match.group(1))
-    unit = match.group(2).lower()
-    if unit.startswith("s"):
-        return timedelta(seconds=amount)
-    if unit.startswith("m"):
-        return timedelta(minutes=amount)
-    return timedelta(hours=amount)
+    unit = WINDOW_UNITS[match.group(2).lower()]
+    return timedelta(**{unit: amount})
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import mmap
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from rich.console import Console
+import requests
+from requests.adapters import HTTPAdapter
+from rich import get_console
 from rich.progress import (
     BarColumn,
     Progress,
@@ -13,37 +26,65 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
+from .cache import read_json_cache, write_json_cache
 from .config import (
-    AUDIO_EXTENSIONS,
-    VIDEO_UPLOAD_EXTENSIONS,
+    DEFAULT_FFMPEG_PARALLELISM,
+    DEFAULT_FRAMEIO_WORKERS,
+    FRAMEIO_DESTINATION_CACHE_FILE,
+    FRAMEIO_DESTINATION_CACHE_TTL,
+    FRAMEIO_UPLOAD_MAX_RETRIES,
+    FRAMEIO_UPLOAD_PART_WORKERS,
+    FRAMEIO_UPLOAD_RETRY_BACKOFF_SECONDS,
+    UPLOAD_EXTENSIONS,
+)
+from .resource import (
+    EpisodeGroup,
+    collect_mov_files,
+    conversion_succeeded,
+    ffmpeg_available,
+    ffmpeg_threads_per_job,
+    plan_mov_conversions,
+    print_conversion_failures,
+    run_mov_conversions,
+    stream_ffmpeg,
 )
-from .resource import EpisodeGroup
 
-console = Console()
+console = get_console()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UploadJob:
     episode_dir: Path
     file_path: Path
     destination_folder_id: str
 
 
+@dataclass(slots=True)
+class FrameioUploadContext:
+    client: Any
+    destination_root_id: str
+    upload_session: requests.Session
+    folder_ids_cache: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
 def collect_upload_candidates(
     episode_groups: list[EpisodeGroup],
 ) -> dict[Path, list[Path]]:
+    # Episode directories are created fresh for each run and only hold the
+    # files moved into them, so the move results already list their contents
+    # and no directory needs to be rescanned. Candidates come back ordered by
+    # episode and then file name, so callers can iterate the mapping directly.
     candidates: dict[Path, list[Path]] = {}
-    for group in episode_groups:
-        files: list[Path] = []
-        for path in sorted(
-            group.episode_dir.iterdir(), key=lambda item: item.name.lower()
-        ):
-            if not path.is_file():
-                continue
-            suffix = path.suffix.lower()
-            if suffix in AUDIO_EXTENSIONS or suffix in VIDEO_UPLOAD_EXTENSIONS:
-                files.append(path)
+    for group in sorted(
+        episode_groups, key=lambda group: group.episode_dir.name.lower()
+    ):
+        files = [
+            file.path
+            for file in group.files
+            if os.path.splitext(file.path.name)[1].lower() in UPLOAD_EXTENSIONS
+        ]
         if files:
+            files.sort(key=lambda path: path.name.lower())
             candidates[group.episode_dir] = files
     return candidates
 
@@ -60,6 +101,22 @@ def resolve_frameio_destination_folder_id(client: Any, destination_id: str) -> s
         return project["root_asset_id"]
 
 
+def load_frameio_destination_cache(destination_id: str) -> str | None:
+    cached = read_json_cache(
+        FRAMEIO_DESTINATION_CACHE_FILE, max_age=FRAMEIO_DESTINATION_CACHE_TTL
+    )
+    if cached is None:
+        return None
+    root_asset_id = cached.get(destination_id)
+    return root_asset_id if isinstance(root_asset_id, str) else None
+
+
+def save_frameio_destination_cache(destination_id: str, root_asset_id: str) -> None:
+    cached = read_json_cache(FRAMEIO_DESTINATION_CACHE_FILE) or {}
+    cached[destination_id] = root_asset_id
+    write_json_cache(FRAMEIO_DESTINATION_CACHE_FILE, cached)
+
+
 def iter_asset_children(client: Any, parent_asset_id: str) -> list[dict[str, Any]]:
     children = client.assets.get_children(parent_asset_id)
     if isinstance(children, list):
@@ -67,23 +124,104 @@ def iter_asset_children(client: Any, parent_asset_id: str) -> list[dict[str, Any
     return list(children)
 
 
-def ensure_remote_episode_folder(
-    client: Any, parent_asset_id: str, episode_name: str
-) -> str:
-    for child in iter_asset_children(client, parent_asset_id):
-        if child.get("type") == "folder" and child.get("name") == episode_name:
-            return child["id"]
+def remote_folder_ids(
+    context: FrameioUploadContext, parent_asset_id: str
+) -> dict[str, str]:
+    cached = context.folder_ids_cache.get(parent_asset_id)
+    if cached is not None:
+        return cached
 
-    created = client.assets.create(
-        parent_asset_id,
-        type="folder",
-        name=episode_name,
-    )
-    return created["id"]
+    folder_ids: dict[str, str] = {}
+    for child in iter_asset_children(context.client, parent_asset_id):
+        if child.get("type") == "folder":
+            folder_ids.setdefault(child.get("name"), child["id"])
+    context.folder_ids_cache[parent_asset_id] = folder_ids
+    return folder_ids
+
+
+def map_file_range(local_file: Path, offset: int, length: int) -> memoryview:
+    # Parts are sent straight out of the page cache through a read-only
+    # mapping instead of being copied into a bytes buffer first. The mapping
+    # is released once the last view of it is dropped.
+    with local_file.open("rb") as handle:
+        length = min(length, os.fstat(handle.fileno()).st_size - offset)
+        if length <= 0:
+            return memoryview(b"")
+        aligned_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+        mapped = mmap.mmap(
+            handle.fileno(),
+            length + offset - aligned_offset,
+            offset=aligned_offset,
+            access=mmap.ACCESS_READ,
+        )
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return memoryview(mapped)[offset - aligned_offset :]
+
+
+def upload_file_part(
+    session: requests.Session,
+    url: str,
+    local_file: Path,
+    offset: int,
+    length: int,
+    headers: dict[str, str],
+) -> None:
+    data = map_file_range(local_file, offset, length)
+    for attempt in range(FRAMEIO_UPLOAD_MAX_RETRIES + 1):
+        final_attempt = attempt == FRAMEIO_UPLOAD_MAX_RETRIES
+        try:
+            response = session.put(url, data=data, headers=headers)
+        except requests.ConnectionError:
+            if final_attempt:
+                raise
+        else:
+            if response.status_code < 500 or final_attempt:
+                response.raise_for_status()
+                return
+        time.sleep(FRAMEIO_UPLOAD_RETRY_BACKOFF_SECONDS * 2**attempt)
+
+
+def upload_file_parts(
+    upload_urls: list[str],
+    local_file: Path,
+    filesize: int,
+    mimetype: str,
+    session: requests.Session,
+    workers: int = FRAMEIO_UPLOAD_PART_WORKERS,
+) -> None:
+    # Frame.io presigns one URL per part and expects the file split evenly
+    # across them, with the final part taking the remainder.
+    part_size = math.ceil(filesize / len(upload_urls))
+    headers = {"content-type": mimetype, "x-amz-acl": "private"}
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(upload_urls))) as executor:
+        futures = [
+            executor.submit(
+                upload_file_part,
+                session,
+                url,
+                local_file,
+                index * part_size,
+                part_size,
+                headers,
+            )
+            for index, url in enumerate(upload_urls)
+        ]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                for pending in futures:
+                    pending.cancel()
+                raise
 
 
 def upload_file_to_frameio(
-    client: Any, destination_folder_id: str, local_file: Path
+    client: Any,
+    destination_folder_id: str,
+    local_file: Path,
+    session: requests.Session,
 ) -> dict[str, Any]:
     file_info = client.assets.build_asset_info(str(local_file))
     mimetype = file_info["mimetype"] or "application/octet-stream"
@@ -96,29 +234,55 @@ def upload_file_to_frameio(
         filesize=file_info["filesize"],
     )
 
-    with local_file.open("rb") as handle:
-        client.assets._upload(remote_asset, handle)
+    upload_urls = remote_asset.get("upload_urls")
+    if upload_urls:
+        upload_file_parts(
+            upload_urls, local_file, file_info["filesize"], mimetype, session
+        )
+    else:
+        with local_file.open("rb") as handle:
+            client.assets._upload(remote_asset, handle)
 
     return remote_asset
 
 
-def upload_episode_files_to_frameio(
-    episode_groups: list[EpisodeGroup],
-    token: str,
-    destination_id: str,
-) -> int:
-    upload_candidates = collect_upload_candidates(episode_groups)
-    if not upload_candidates:
-        console.print("No audio or .mp4 files found for Frame.io upload.")
-        return 0
+def submit_upload_job(
+    executor: ThreadPoolExecutor, context: FrameioUploadContext, job: UploadJob
+) -> Future[dict[str, Any]]:
+    return executor.submit(
+        upload_file_to_frameio,
+        context.client,
+        job.destination_folder_id,
+        job.file_path,
+        context.upload_session,
+    )
+
 
+def mount_pooled_adapter(
+    session: requests.Session, pool_size: int, max_retries: Any = 0
+) -> None:
+    # requests keeps 10 connections per host by default; with more upload
+    # threads than that, extra connections are dropped after each request
+    # and the next call pays for a fresh TCP/TLS handshake.
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def build_frameio_upload_context(
+    token: str, destination_id: str, workers: int = DEFAULT_FRAMEIO_WORKERS
+) -> FrameioUploadContext | None:
     try:
         from frameioclient import FrameioClient
     except ImportError as exc:
         console.print(
             f"Failed to import frameioclient: {exc}", style="bold red", markup=False
         )
-        return 1
+        return None
 
     try:
         client = FrameioClient(token)
@@ -129,44 +293,142 @@ def upload_episode_files_to_frameio(
             style="bold red",
         )
         console.print(str(exc), style="red", markup=False)
-        return 1
+        return None
 
-    try:
-        destination_root_id = resolve_frameio_destination_folder_id(
-            client, destination_id
+    # Size the client's API pool for concurrent upload threads, keeping its
+    # retry policy; part PUTs get their own shared session below.
+    api_session = getattr(client, "session", None)
+    if isinstance(api_session, requests.Session):
+        mount_pooled_adapter(
+            api_session,
+            pool_size=workers + 1,
+            max_retries=getattr(client, "retry_strategy", 0),
         )
-    except Exception as exc:
-        console.print(
-            f"Failed to resolve FRAMEIO_DESTINATION_ID '{destination_id}': {exc}",
-            style="bold red",
-            markup=False,
-        )
-        return 1
 
-    upload_jobs: list[UploadJob] = []
-    for episode_dir in sorted(upload_candidates, key=lambda item: item.name.lower()):
+    destination_root_id = load_frameio_destination_cache(destination_id)
+    if destination_root_id is None:
         try:
-            remote_folder_id = ensure_remote_episode_folder(
-                client, destination_root_id, episode_dir.name
+            destination_root_id = resolve_frameio_destination_folder_id(
+                client, destination_id
             )
         except Exception as exc:
             console.print(
-                f"Failed to create/find remote folder '{episode_dir.name}': {exc}",
+                f"Failed to resolve FRAMEIO_DESTINATION_ID '{destination_id}': {exc}",
                 style="bold red",
                 markup=False,
             )
-            return 1
-
-        for file_path in upload_candidates[episode_dir]:
-            upload_jobs.append(
-                UploadJob(
-                    episode_dir=episode_dir,
-                    file_path=file_path,
-                    destination_folder_id=remote_folder_id,
+            return None
+        save_frameio_destination_cache(destination_id, destination_root_id)
+
+    upload_session = requests.Session()
+    mount_pooled_adapter(
+        upload_session, pool_size=workers * FRAMEIO_UPLOAD_PART_WORKERS
+    )
+    return FrameioUploadContext(
+        client=client,
+        destination_root_id=destination_root_id,
+        upload_session=upload_session,
+    )
+
+
+def resolve_episode_folder_ids(
+    context: FrameioUploadContext, episode_dirs: list[Path]
+) -> dict[Path, str] | None:
+    # The destination root is listed once into a name -> id map; only
+    # episodes missing from it cost an extra create call.
+    parent_asset_id = context.destination_root_id
+    folder_ids: dict[Path, str] = {}
+    for episode_dir in sorted(episode_dirs, key=lambda item: item.name.lower()):
+        episode_name = episode_dir.name
+        try:
+            existing_folder_ids = remote_folder_ids(context, parent_asset_id)
+            folder_id = existing_folder_ids.get(episode_name)
+            if folder_id is None:
+                created = context.client.assets.create(
+                    parent_asset_id,
+                    type="folder",
+                    name=episode_name,
                 )
+                folder_id = created["id"]
+                existing_folder_ids[episode_name] = folder_id
+        except Exception as exc:
+            console.print(
+                f"Failed to create/find remote folder '{episode_name}': {exc}",
+                style="bold red",
+                markup=False,
             )
+            return None
+        folder_ids[episode_dir] = folder_id
+    return folder_ids
+
+
+def convert_and_upload_episode_files(
+    episode_groups: list[EpisodeGroup],
+    token: str,
+    destination_id: str,
+    workers: int = DEFAULT_FRAMEIO_WORKERS,
+    ffmpeg_parallelism: int = DEFAULT_FFMPEG_PARALLELISM,
+    hwaccel: bool = True,
+    fragmented: bool = False,
+) -> int:
+    # Audio and existing .mp4 files start uploading immediately, and each
+    # converted _HQ.mp4 is submitted as soon as its ffmpeg process exits, so
+    # encoding and network transfer overlap instead of running back to back.
+    # Collect before any conversion starts so half-written outputs are never
+    # picked up; converted files are queued individually once complete.
+    upload_candidates = collect_upload_candidates(episode_groups)
+    mov_files = collect_mov_files(episode_groups)
+    if not mov_files:
+        console.print("No .mov files found for conversion.")
+    elif not ffmpeg_available():
+        return 1
+
+    if not upload_candidates and not mov_files:
+        console.print("No audio or .mp4 files found for Frame.io upload.")
+        return 0
+
+    context = build_frameio_upload_context(token, destination_id, workers=workers)
+    if context is None:
+        run_mov_conversions(
+            plan_mov_conversions(mov_files),
+            parallelism=ffmpeg_parallelism,
+            hwaccel=hwaccel,
+            fragmented=fragmented,
+        )
+        return 1
+
+    conversions = plan_mov_conversions(mov_files)
+    folder_ids = resolve_episode_folder_ids(
+        context,
+        list(set(upload_candidates) | {output.parent for _, output in conversions}),
+    )
+    if folder_ids is None:
+        context.upload_session.close()
+        run_mov_conversions(
+            conversions,
+            parallelism=ffmpeg_parallelism,
+            hwaccel=hwaccel,
+            fragmented=fragmented,
+        )
+        return 1
 
-    failures: list[str] = []
+    upload_jobs = [
+        UploadJob(
+            episode_dir=episode_dir,
+            file_path=file_path,
+            destination_folder_id=folder_ids[episode_dir],
+        )
+        for episode_dir, file_paths in upload_candidates.items()
+        for file_path in file_paths
+    ]
+    if not upload_jobs and not conversions:
+        console.print("No audio or .mp4 files found for Frame.io upload.")
+        return 0
+
+    threads_per_job = ffmpeg_threads_per_job(ffmpeg_parallelism)
+    conversion_failures: list[Path] = []
+    upload_failures: list[str] = []
+    upload_total = len(upload_jobs) + len(conversions)
     with Progress(
         SpinnerColumn(),
         TextColumn("[bold cyan]{task.description}"),
@@ -175,26 +437,71 @@ def upload_episode_files_to_frameio(
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        upload_task = progress.add_task("Uploading to Frame.io", total=len(upload_jobs))
-        for job in upload_jobs:
-            progress.console.print(
-                f"Uploading {job.file_path.name} -> {job.episode_dir.name}",
-                markup=False,
-            )
-            try:
-                upload_file_to_frameio(
-                    client,
-                    destination_folder_id=job.destination_folder_id,
-                    local_file=job.file_path,
-                )
-            except Exception as exc:
-                failures.append(f"{job.file_path}: {exc}")
-            progress.advance(upload_task)
+        convert_task = progress.add_task(
+            "Converting .mov to _HQ.mp4", total=len(conversions)
+        )
+        upload_task = progress.add_task("Uploading to Frame.io", total=upload_total)
+        with (
+            ThreadPoolExecutor(max_workers=max(ffmpeg_parallelism, 1)) as converter,
+            ThreadPoolExecutor(max_workers=max(workers, 1)) as uploader,
+        ):
+            conversion_map = {
+                converter.submit(
+                    stream_ffmpeg,
+                    mov_file,
+                    output_path,
+                    threads_per_job,
+                    hwaccel,
+                    fragmented,
+                ): (mov_file, output_path)
+                for mov_file, output_path in conversions
+            }
+            upload_map = {
+                submit_upload_job(uploader, context, job): job for job in upload_jobs
+            }
+
+            pending: set[Future[Any]] = set(conversion_map) | set(upload_map)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in conversion_map:
+                        mov_file, output_path = conversion_map[future]
+                        progress.advance(convert_task)
+                        if not conversion_succeeded(future, mov_file):
+                            conversion_failures.append(mov_file)
+                            upload_total -= 1
+                            progress.update(upload_task, total=upload_total)
+                            continue
 
-    if failures:
-        console.print(f"{len(failures)} upload(s) failed.", style="bold red")
-        for failure in failures:
+                        job = UploadJob(
+                            episode_dir=output_path.parent,
+                            file_path=output_path,
+                            destination_folder_id=folder_ids[output_path.parent],
+                        )
+                        upload_future = submit_upload_job(uploader, context, job)
+                        upload_map[upload_future] = job
+                        pending.add(upload_future)
+                        continue
+
+                    job = upload_map[future]
+                    try:
+                        future.result()
+                        progress.console.print(
+                            f"Uploaded {job.file_path.name} -> {job.episode_dir.name}",
+                            markup=False,
+                        )
+                    except Exception as exc:
+                        upload_failures.append(f"{job.file_path}: {exc}")
+                    progress.advance(upload_task)
+
+    context.upload_session.close()
+
+    if conversion_failures:
+        print_conversion_failures(conversion_failures)
+
+    if upload_failures:
+        console.print(f"{len(upload_failures)} upload(s) failed.", style="bold red")
+        for failure in upload_failures:
             console.print(f"  - {failure}", markup=False)
-        return 1
 
-    return 0
+    return 1 if conversion_failures or upload_failures else 0
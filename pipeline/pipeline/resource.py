@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import codecs
+import errno
+import heapq
+import io
 import os
+import plistlib
+import re
+import select
 import shutil
+import stat
 import subprocess
+import sys
+import time
 from collections import defaultdict, deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cache, lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
-from rich.console import Console
+from rich import get_console
 from rich.progress import (
     BarColumn,
     Progress,
@@ -18,32 +38,54 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from .config import EPISODE_PATTERN
+from .attrlist import list_directory_bulk
+from .cache import read_json_cache, write_json_cache
+from .config import (
+    DEFAULT_FFMPEG_PARALLELISM,
+    DEFAULT_MOVE_WORKERS,
+    DEFAULT_SCAN_WORKERS,
+    DEFAULT_SOURCE_SCAN_WORKERS,
+    DEFAULT_VOLUMES_ROOT,
+    EPISODE_INDEX_CACHE_FILE,
+    EPISODE_INDEX_RACY_SECONDS,
+    EPISODE_PATTERN,
+    EXCLUDED_DIR_NAMES,
+    FFMPEG_LOG_BATCH_LINES,
+    FFMPEG_LOG_FLUSH_SECONDS,
+    FFMPEG_PROGRESS_SUMMARY_FIELDS,
+    HDD_MOVE_WORKERS,
+    NETWORK_FILESYSTEM_TYPES,
+    NETWORK_MOVE_WORKERS,
+    SCAN_CACHE_FILE,
+    SCAN_CACHE_TTL,
+    SSD_MOVE_WORKERS,
+    UNRELIABLE_DIRECTORY_MTIME_FILESYSTEMS,
+)
 
-console = Console()
+console = get_console()
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceOption:
     name: str
     path: Path
     selected: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaFile:
     source: str
     path: Path
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaGroup:
     start_time: datetime
     files: list[MediaFile]
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeGroup:
     episode_dir: Path
     start_time: datetime
@@ -51,36 +93,142 @@ class EpisodeGroup:
 
 
 def discover_sources(
-    audiohijack_path: Path, volumes_root: Path = Path("/Volumes")
+    audiohijack_path: Path, volumes_root: Path = DEFAULT_VOLUMES_ROOT
 ) -> list[SourceOption]:
     options = [SourceOption(name="AudioHijack", path=audiohijack_path, selected=True)]
 
     if volumes_root.exists():
-        for entry in sorted(volumes_root.iterdir(), key=lambda path: path.name.lower()):
+        with os.scandir(volumes_root) as entries:
+            sorted_entries = sorted(entries, key=lambda entry: entry.name.lower())
+        for entry in sorted_entries:
             if not entry.is_dir():
                 continue
-            options.append(SourceOption(name=entry.name, path=entry, selected=False))
+            options.append(
+                SourceOption(name=entry.name, path=Path(entry.path), selected=False)
+            )
 
     return options
 
 
-def iter_files(root: Path):
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
-            yield Path(dirpath) / filename
+def is_excluded_directory(entry: os.DirEntry[str]) -> bool:
+    if entry.name in EXCLUDED_DIR_NAMES:
+        return True
+    # Finder-hidden directories (UF_HIDDEN) only exist on macOS; elsewhere
+    # skip the extra stat.
+    if sys.platform != "darwin":
+        return False
+    return bool(entry.stat(follow_symlinks=False).st_flags & stat.UF_HIDDEN)
+
+
+def list_directory(
+    path: str,
+    modified_since: float | None = None,
+    unreadable: list[str] | None = None,
+) -> tuple[list[tuple[str, float]], list[str]]:
+    listing = list_directory_bulk(path, modified_since)
+    if listing is not None:
+        return listing
+
+    files: list[tuple[str, float]] = []
+    subdirectories: list[str] = []
+    # Directories that can't be opened or fully listed are skipped, but
+    # recorded in unreadable so the caller knows the walk was incomplete.
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        if unreadable is not None:
+            unreadable.append(path)
+        return files, subdirectories
+    try:
+        # Adding, renaming or removing an entry bumps its directory's mtime,
+        # so a directory untouched since modified_since holds no newer files
+        # and its files need no stat. Nested directories keep their own
+        # mtimes, so descent is never skipped.
+        include_files = (
+            modified_since is None or os.fstat(fd).st_mtime >= modified_since
+        )
+        # Listing through the descriptor makes each entry's stat an fstatat()
+        # relative to it rather than a lookup of the full path; entries then
+        # only carry their name.
+        with os.scandir(fd) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink() and not is_excluded_directory(entry):
+                            subdirectories.append(os.path.join(path, entry.name))
+                        continue
+                except OSError:
+                    continue
+                if not include_files:
+                    continue
+                # Stat on the worker thread so the per-file metadata round
+                # trips run in parallel too.
+                created_ts = safe_created_ts(entry)
+                if created_ts is not None:
+                    files.append((os.path.join(path, entry.name), created_ts))
+    except OSError:
+        if unreadable is not None:
+            unreadable.append(path)
+    finally:
+        os.close(fd)
+    return files, subdirectories
+
+
+def find_existing_source_paths(
+    sources: list[SourceOption], volumes_root: Path = DEFAULT_VOLUMES_ROOT
+) -> set[Path]:
+    # Mounted volumes all live directly under volumes_root, so one listing
+    # answers them together instead of a stat (and possible automount wait)
+    # per volume. Anything elsewhere falls back to its own exists() check.
+    try:
+        mounted_names = set(os.listdir(volumes_root))
+    except OSError:
+        mounted_names = set()
+
+    existing: set[Path] = set()
+    for source in sources:
+        if source.path.parent == volumes_root:
+            if source.path.name in mounted_names:
+                existing.add(source.path)
+        elif source.path.exists():
+            existing.add(source.path)
+    return existing
+
+
+def iter_files(
+    root: Path,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    modified_since: float | None = None,
+    unreadable: list[str] | None = None,
+) -> Iterator[tuple[str, float]]:
+    # Every directory is listed as its own pool task, so a deep tree on a
+    # slow volume keeps several readdir/stat calls in flight at once.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {
+            executor.submit(list_directory, str(root), modified_since, unreadable)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                for subdirectory in subdirectories:
+                    pending.add(
+                        executor.submit(
+                            list_directory, subdirectory, modified_since, unreadable
+                        )
+                    )
+                yield from files
 
 
-def safe_created_at(path: Path) -> datetime | None:
+def safe_created_ts(entry: os.DirEntry[str]) -> float | None:
     try:
-        stat = path.stat()
+        entry_stat = entry.stat()
     except OSError:
         return None
 
-    created_ts = getattr(stat, "st_birthtime", stat.st_mtime)
-    return datetime.fromtimestamp(created_ts)
+    return getattr(entry_stat, "st_birthtime", entry_stat.st_mtime)
 
 
 def scan_source_for_today_files(
@@ -89,40 +237,57 @@ def scan_source_for_today_files(
     day_end: datetime,
     progress: Progress,
     task_id: int,
-) -> list[MediaFile]:
+    prune: bool = True,
+) -> tuple[list[MediaFile], list[str]]:
     checked_since_update = 0
     matches: list[MediaFile] = []
-
-    for file_path in iter_files(source.path):
+    unreadable: list[str] = []
+    # Compare raw timestamps and only build a datetime for files that match.
+    day_start_ts = day_start.timestamp()
+    day_end_ts = day_end.timestamp()
+    # With prune, files in directories whose mtime predates day_start are
+    # skipped unread (see list_directory). That only holds on filesystems that
+    # keep directory mtimes current, so other sources are always read in
+    # full. --no-prune covers files dropped in with tools that restore the
+    # directory's old mtime.
+    if prune and directory_mtimes_reliable(source.path):
+        modified_since = day_start_ts
+    else:
+        modified_since = None
+
+    for file_path, created_ts in iter_files(
+        source.path, modified_since=modified_since, unreadable=unreadable
+    ):
         checked_since_update += 1
         if checked_since_update >= 50:
             progress.update(task_id, advance=checked_since_update)
             checked_since_update = 0
 
-        created_at = safe_created_at(file_path)
-        if created_at is None:
-            continue
-        if day_start <= created_at < day_end:
+        if day_start_ts <= created_ts < day_end_ts:
             matches.append(
                 MediaFile(
                     source=source.name,
-                    path=file_path,
-                    created_at=created_at,
+                    path=Path(file_path),
+                    created_at=datetime.fromtimestamp(created_ts),
                 )
             )
 
     if checked_since_update:
         progress.update(task_id, advance=checked_since_update)
 
-    return matches
+    return matches, unreadable
 
 
 def scan_sources_for_today_files(
     sources: list[SourceOption],
     day_start: datetime,
     day_end: datetime,
-) -> list[MediaFile]:
-    all_files: list[MediaFile] = []
+    prune: bool = True,
+) -> tuple[list[MediaFile], bool]:
+    # Also reports whether every source and directory was read, so a partial
+    # result is never cached and reused.
+    files_by_source: list[list[MediaFile]] = [[] for _ in sources]
+    complete = True
 
     with Progress(
         SpinnerColumn(),
@@ -133,85 +298,198 @@ def scan_sources_for_today_files(
         console=console,
     ) as progress:
         overall_task = progress.add_task("Completed sources", total=len(sources))
-        for source in sources:
-            task_id = progress.add_task(f"Scanning {source.name}", total=None)
-            try:
-                source_files = scan_source_for_today_files(
+        # Sources are usually separate volumes, so walk them concurrently and
+        # let the slowest one bound the scan instead of the sum of all of them.
+        with ThreadPoolExecutor(
+            max_workers=min(max(len(sources), 1), DEFAULT_SOURCE_SCAN_WORKERS)
+        ) as executor:
+            future_to_source: dict[Future, tuple[int, SourceOption, int]] = {}
+            for index, source in enumerate(sources):
+                task_id = progress.add_task(f"Scanning {source.name}", total=None)
+                future = executor.submit(
+                    scan_source_for_today_files,
                     source,
                     day_start,
                     day_end,
                     progress,
                     task_id,
+                    prune,
                 )
-                all_files.extend(source_files)
-                progress.update(
-                    task_id,
-                    description=f"Scanned {source.name}: {len(source_files)} matches",
-                )
-            except Exception as exc:
-                progress.update(task_id, description=f"Failed {source.name}: {exc}")
-            finally:
-                progress.stop_task(task_id)
-                progress.advance(overall_task, 1)
+                future_to_source[future] = (index, source, task_id)
+
+            for future in as_completed(future_to_source):
+                index, source, task_id = future_to_source[future]
+                try:
+                    source_files, unreadable = future.result()
+                    files_by_source[index] = source_files
+                    description = f"Scanned {source.name}: {len(source_files)} matches"
+                    if unreadable:
+                        complete = False
+                        description += f", {len(unreadable)} unreadable folder(s)"
+                    progress.update(task_id, description=description)
+                except Exception as exc:
+                    complete = False
+                    progress.update(task_id, description=f"Failed {source.name}: {exc}")
+                finally:
+                    progress.stop_task(task_id)
+                    progress.advance(overall_task, 1)
+
+    # Concatenate in source order rather than completion order so equal
+    # timestamps group the same way on every run. Otherwise left unsorted;
+    # group_files_by_start_time orders files itself.
+    files = [media for source_files in files_by_source for media in source_files]
+    return files, complete
 
-    return sorted(all_files, key=lambda media: media.created_at)
+
+def scan_cache_key(
+    sources: list[SourceOption],
+    day_start: datetime,
+    day_end: datetime,
+    prune: bool,
+) -> dict[str, Any] | None:
+    # A cached scan is reused only for the same window and sources, and only
+    # while each source root's mtime is unchanged (new recordings land
+    # directly in the AudioHijack folder). Nested folders such as an SD
+    # card's DCIM/100CAM don't bump the root, which is why reuse is opt-in
+    # (--resume). Taken before scanning so anything that changes mid-scan
+    # invalidates the entry.
+    source_keys: list[list[Any]] = []
+    for source in sources:
+        try:
+            mtime = source.path.stat().st_mtime
+        except OSError:
+            return None
+        source_keys.append([source.name, str(source.path), mtime])
+    return {
+        "day_start": day_start.timestamp(),
+        "day_end": day_end.timestamp(),
+        "prune": prune,
+        "sources": source_keys,
+    }
+
+
+def load_scan_cache(key: dict[str, Any]) -> list[MediaFile] | None:
+    cached = read_json_cache(SCAN_CACHE_FILE, max_age=SCAN_CACHE_TTL)
+    if cached is None or cached.get("key") != key:
+        return None
+
+    files: list[MediaFile] = []
+    try:
+        for source_name, path, created_ts in cached["files"]:
+            # Files moved into episode folders by an earlier run are gone
+            # from their source, exactly as a fresh scan would find.
+            if not os.path.exists(path):
+                continue
+            files.append(
+                MediaFile(
+                    source=source_name,
+                    path=Path(path),
+                    created_at=datetime.fromtimestamp(created_ts),
+                )
+            )
+    except (KeyError, TypeError, ValueError):
+        return None
+    return files
+
+
+def save_scan_cache(key: dict[str, Any], files: list[MediaFile]) -> None:
+    write_json_cache(
+        SCAN_CACHE_FILE,
+        {
+            "key": key,
+            "files": [
+                [media.source, str(media.path), media.created_at.timestamp()]
+                for media in files
+            ],
+        },
+    )
 
 
 def group_files_by_start_time(
     files: list[MediaFile], window: timedelta
 ) -> list[MediaGroup]:
     grouped_by_source: dict[str, deque[MediaFile]] = defaultdict(deque)
-    for file in sorted(files, key=lambda item: item.created_at):
+    for file in sorted(files, key=attrgetter("created_at")):
         grouped_by_source[file.source].append(file)
 
-    groups: list[MediaGroup] = []
-    window_seconds = window.total_seconds()
-
-    while True:
-        next_candidates = [queue[0] for queue in grouped_by_source.values() if queue]
-        if not next_candidates:
-            break
+    # Heap of each source's earliest remaining file. A group takes the head of
+    # every source within the window of the earliest head, so each file is
+    # pushed and popped once. The index breaks ties in source order.
+    heads = [
+        (queue[0].created_at, index, queue)
+        for index, queue in enumerate(grouped_by_source.values())
+    ]
+    heapq.heapify(heads)
 
-        anchor = min(next_candidates, key=lambda item: item.created_at)
-        anchor_time = anchor.created_at
+    groups: list[MediaGroup] = []
+    while heads:
+        anchor_time = heads[0][0]
+        cutoff = anchor_time + window
         group_files: list[MediaFile] = []
-
-        for queue in grouped_by_source.values():
-            if not queue:
-                continue
-            candidate = queue[0]
-            delta = abs((candidate.created_at - anchor_time).total_seconds())
-            if delta <= window_seconds:
-                group_files.append(queue.popleft())
-
-        if not group_files:
-            queue = grouped_by_source[anchor.source]
+        next_heads = []
+        while heads and heads[0][0] <= cutoff:
+            _, index, queue = heapq.heappop(heads)
+            group_files.append(queue.popleft())
             if queue:
-                group_files.append(queue.popleft())
+                next_heads.append((queue[0].created_at, index, queue))
+        for head in next_heads:
+            heapq.heappush(heads, head)
 
-        groups.append(
-            MediaGroup(
-                start_time=min(file.created_at for file in group_files),
-                files=sorted(group_files, key=lambda item: item.created_at),
-            )
-        )
+        groups.append(MediaGroup(start_time=anchor_time, files=group_files))
 
-    return sorted(groups, key=lambda group: group.start_time)
+    # Anchors are popped in time order, so groups are already sorted.
+    return groups
 
 
 def find_existing_episode_numbers(podcast_root: Path) -> list[int]:
-    if not podcast_root.exists():
+    try:
+        mtime_ns = os.stat(podcast_root).st_mtime_ns
+    except OSError:
         return []
-
+    return list(episode_numbers_at(str(podcast_root), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def episode_numbers_at(podcast_root: str, mtime_ns: int) -> tuple[int, ...]:
+    # Keyed on the root's mtime: creating or removing an episode folder bumps
+    # it, so the CLI summary and allocate_episode_directories share one
+    # listing until the folder set actually changes. The same key lets later
+    # runs reuse the on-disk index and skip listing a large (often network)
+    # podcast_root entirely.
+    cached = read_json_cache(EPISODE_INDEX_CACHE_FILE) or {}
+    entry = cached.get(podcast_root)
+    if isinstance(entry, dict) and entry.get("mtime_ns") == mtime_ns:
+        numbers = entry.get("numbers")
+        if isinstance(numbers, list) and all(isinstance(n, int) for n in numbers):
+            return tuple(numbers)
+
+    numbers = scan_episode_numbers(podcast_root)
+    if numbers is None:
+        return ()
+    # A root modified within the mtime granularity of now could change again
+    # (say, by the episode folder this run is about to create) without its
+    # mtime moving, so only persist listings of a root that has settled.
+    if time.time() - mtime_ns / 1e9 >= EPISODE_INDEX_RACY_SECONDS:
+        cached[podcast_root] = {"mtime_ns": mtime_ns, "numbers": list(numbers)}
+        write_json_cache(EPISODE_INDEX_CACHE_FILE, cached)
+    return numbers
+
+
+def scan_episode_numbers(podcast_root: str) -> tuple[int, ...] | None:
     numbers: list[int] = []
-    for entry in podcast_root.iterdir():
-        if not entry.is_dir():
-            continue
-        match = EPISODE_PATTERN.match(entry.name)
-        if match:
-            numbers.append(int(match.group(1)))
+    try:
+        with os.scandir(podcast_root) as entries:
+            for entry in entries:
+                # The prefix test rejects most names before the regex runs.
+                if not entry.name.startswith("episode_") or not entry.is_dir():
+                    continue
+                match = EPISODE_PATTERN.match(entry.name)
+                if match:
+                    numbers.append(int(match.group(1)))
+    except OSError:
+        return None
 
-    return sorted(numbers)
+    return tuple(sorted(numbers))
 
 
 def allocate_episode_directories(podcast_root: Path, group_count: int) -> list[Path]:
@@ -229,29 +507,126 @@ def allocate_episode_directories(podcast_root: Path, group_count: int) -> list[P
     return episode_directories
 
 
+def directory_mtimes_reliable(path: Path) -> bool:
+    # An unknown filesystem type is treated as unreliable too.
+    filesystem_type = mounted_filesystem_types().get(mount_point(str(path)))
+    return (
+        filesystem_type is not None
+        and filesystem_type not in UNRELIABLE_DIRECTORY_MTIME_FILESYSTEMS
+    )
+
+
+@cache
+def mount_point(directory: str) -> str:
+    path = os.path.realpath(directory)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+@cache
+def mounted_filesystem_types() -> dict[str, str]:
+    # Maps each mount point to its filesystem type. Linux lists mounts in
+    # /proc (with octal escapes for spaces); macOS only through mount(8),
+    # whose lines read "//user@host/share on /Volumes/Share (smbfs, ...)".
+    types: dict[str, str] = {}
+    if sys.platform == "darwin":
+        try:
+            result = subprocess.run(
+                ["mount"], capture_output=True, text=True, check=True, timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            return types
+        for line in result.stdout.splitlines():
+            match = re.match(r".+? on (.+) \(([^,)]+)", line)
+            if match:
+                types[match.group(1)] = match.group(2)
+        return types
+
+    try:
+        with open("/proc/self/mounts", encoding="utf-8") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = re.sub(
+                    r"\\([0-7]{3})", lambda octal: chr(int(octal[1], 8)), fields[1]
+                )
+                types[mount] = fields[2]
+    except OSError:
+        pass
+    return types
+
+
+@cache
+def storage_move_workers(mount: str) -> int:
+    if mounted_filesystem_types().get(mount) in NETWORK_FILESYSTEM_TYPES:
+        return NETWORK_MOVE_WORKERS
+    # diskutil reports whether the backing disk is solid state. Anything it
+    # can't describe (other platforms, disk images) keeps the default.
+    if sys.platform != "darwin":
+        return DEFAULT_MOVE_WORKERS
+    try:
+        result = subprocess.run(
+            ["diskutil", "info", "-plist", mount],
+            capture_output=True,
+            check=True,
+            timeout=10,
+        )
+        info = plistlib.loads(result.stdout)
+    except (OSError, subprocess.SubprocessError, plistlib.InvalidFileException):
+        return DEFAULT_MOVE_WORKERS
+
+    solid_state = info.get("SolidState")
+    if solid_state is True:
+        return SSD_MOVE_WORKERS
+    if solid_state is False:
+        return HDD_MOVE_WORKERS
+    return DEFAULT_MOVE_WORKERS
+
+
+def move_workers_for(paths: list[Path]) -> int:
+    # The slowest disk involved sets the pace: a copy off a spinning source
+    # thrashes just as badly as one onto a spinning destination.
+    mounts = {mount_point(str(path)) for path in paths}
+    return min(storage_move_workers(mount) for mount in mounts)
+
+
 def move_file_to_destination(source_path: Path, destination: Path) -> Path:
-    return Path(shutil.move(str(source_path), str(destination)))
+    # A same-volume move is a single rename; only cross-device moves need
+    # shutil's copy-and-delete fallback.
+    try:
+        os.rename(source_path, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        return Path(shutil.move(str(source_path), str(destination)))
+    return destination
 
 
 def plan_group_destinations(files: list[MediaFile], episode_dir: Path) -> list[Path]:
+    # Snapshot the directory once and resolve collisions against names in
+    # memory rather than calling exists() per candidate.
+    try:
+        taken_names = set(os.listdir(episode_dir))
+    except OSError:
+        taken_names = set()
     planned: list[Path] = []
-    reserved_paths: set[Path] = set()
 
     for media_file in files:
-        candidate = episode_dir / media_file.path.name
-        if candidate.exists() or candidate in reserved_paths:
-            stem = candidate.stem
-            suffix = candidate.suffix
+        name = media_file.path.name
+        if name in taken_names:
+            stem, suffix = os.path.splitext(name)
             counter = 1
-            while True:
-                next_candidate = candidate.with_name(f"{stem}_{counter}{suffix}")
-                if not next_candidate.exists() and next_candidate not in reserved_paths:
-                    candidate = next_candidate
-                    break
+            while f"{stem}_{counter}{suffix}" in taken_names:
                 counter += 1
+            name = f"{stem}_{counter}{suffix}"
 
-        reserved_paths.add(candidate)
-        planned.append(candidate)
+        taken_names.add(name)
+        planned.append(episode_dir / name)
 
     return planned
 
@@ -281,38 +656,46 @@ def move_groups_to_episodes(
         console=console,
     ) as progress:
         move_task = progress.add_task("Moving files", total=total_files)
-        move_jobs: list[tuple[int, MediaFile, Path]] = []
-        for group_index, (group, episode_dir) in enumerate(
-            zip(groups, episode_directories)
-        ):
-            if not dry_run:
-                episode_dir.mkdir(parents=True, exist_ok=False)
-
-            destinations = plan_group_destinations(group.files, episode_dir)
-            for file, destination in zip(group.files, destinations):
-                move_jobs.append((group_index, file, destination))
+        group_pairs = enumerate(zip(groups, episode_directories))
 
         if dry_run:
-            for group_index, file, destination in move_jobs:
-                episode_groups[group_index].files.append(
-                    MediaFile(
-                        source=file.source,
-                        path=destination,
-                        created_at=file.created_at,
+            for group_index, (group, episode_dir) in group_pairs:
+                destinations = plan_group_destinations(group.files, episode_dir)
+                for file, destination in zip(group.files, destinations):
+                    episode_groups[group_index].files.append(
+                        MediaFile(
+                            source=file.source,
+                            path=destination,
+                            created_at=file.created_at,
+                        )
                     )
-                )
-                progress.advance(move_task)
+                    progress.advance(move_task)
             return episode_groups
 
-        max_workers = min(max(total_files, 1), 8)
+        # Create every episode folder up front so a clash still aborts before
+        # any file has moved.
+        for episode_dir in episode_directories:
+            episode_dir.mkdir(parents=True, exist_ok=False)
+
+        max_workers = min(
+            max(total_files, 1),
+            move_workers_for(
+                [podcast_root]
+                + [file.path.parent for group in groups for file in group.files]
+            ),
+        )
         future_map = {}
         move_failures: list[str] = []
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for group_index, file, destination in move_jobs:
-                future = executor.submit(
-                    move_file_to_destination, file.path, destination
-                )
-                future_map[future] = (group_index, file)
+            # Submit each group's moves as soon as it is planned so the first
+            # moves overlap planning of the remaining groups.
+            for group_index, (group, episode_dir) in group_pairs:
+                destinations = plan_group_destinations(group.files, episode_dir)
+                for file, destination in zip(group.files, destinations):
+                    future = executor.submit(
+                        move_file_to_destination, file.path, destination
+                    )
+                    future_map[future] = (group_index, file)
 
             for future in as_completed(future_map):
                 group_index, file = future_map[future]
@@ -333,22 +716,39 @@ def move_groups_to_episodes(
             raise RuntimeError("Failed moves:\n" + "\n".join(move_failures))
 
         for episode_group in episode_groups:
-            episode_group.files.sort(key=lambda media: media.created_at)
+            episode_group.files.sort(key=attrgetter("created_at"))
 
     return episode_groups
 
 
-def ffmpeg_command(input_path: Path, output_path: Path) -> list[str]:
+def ffmpeg_command(
+    input_path: Path,
+    output_path: Path,
+    threads: int | None = None,
+    hwaccel: bool = True,
+    fragmented: bool = False,
+) -> list[str]:
+    thread_args = ["-threads", str(threads)] if threads else []
+    # Decode on the VideoToolbox block the encoder already uses. Frames are
+    # copied back to system memory for the format filter, and ffmpeg falls
+    # back to software decoding for codecs the hardware can't handle.
+    hwaccel_args = ["-hwaccel", "videotoolbox"] if hwaccel else []
+    # +faststart rewrites the whole file after encoding to move the moov atom
+    # up front; a fragmented MP4 is streamable as written and skips that pass.
+    movflags = (
+        "+frag_keyframe+empty_moov+default_base_moof" if fragmented else "+faststart"
+    )
     return [
-        "ffmpeg",
+        ffmpeg_path() or "ffmpeg",
         "-hide_banner",
         "-loglevel",
-        "debug",
-        "-stats",
+        "error",
         "-stats_period",
         "1",
         "-progress",
         "pipe:2",
+        *thread_args,
+        *hwaccel_args,
         "-i",
         str(input_path),
         "-map",
@@ -374,43 +774,177 @@ def ffmpeg_command(input_path: Path, output_path: Path) -> list[str]:
         "-b:a",
         "192k",
         "-movflags",
-        "+faststart",
+        movflags,
         str(output_path),
     ]
 
 
-def stream_ffmpeg(input_path: Path, output_path: Path) -> int:
-    command = ffmpeg_command(input_path, output_path)
+def summarize_ffmpeg_output(lines: list[str], fields: dict[str, str]) -> list[str]:
+    # -progress writes key=value lines and closes each update with a
+    # progress= line; fold every update into a single status line. Anything
+    # else is an error message and is passed through unchanged.
+    output: list[str] = []
+    for line in lines:
+        key, separator, value = line.partition("=")
+        if not separator or " " in key:
+            if line.strip():
+                output.append(line.rstrip())
+            continue
+        fields[key] = value.strip()
+        if key == "progress":
+            output.append(
+                " ".join(
+                    f"{name}={fields[name]}"
+                    for name in FFMPEG_PROGRESS_SUMMARY_FIELDS
+                    if name in fields
+                )
+            )
+            fields.clear()
+    return output
+
+
+def stream_ffmpeg(
+    input_path: Path,
+    output_path: Path,
+    threads: int | None = None,
+    hwaccel: bool = True,
+    fragmented: bool = False,
+) -> int:
+    command = ffmpeg_command(
+        input_path,
+        output_path,
+        threads=threads,
+        hwaccel=hwaccel,
+        fragmented=fragmented,
+    )
     process = subprocess.Popen(
         command,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
     )
 
     assert process.stderr is not None
-    for line in process.stderr:
-        console.print(line.rstrip(), markup=False)
+    # Drain stderr in chunks and print it in batches so Rich renders a few
+    # times a second instead of once per line; a slow consumer would
+    # otherwise fill the pipe and stall ffmpeg. The newline decoder treats
+    # -stats' carriage returns as line breaks, as text mode did.
+    fd = process.stderr.fileno()
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    prefix = f"[{input_path.name}] "
+    partial = ""
+    progress_fields: dict[str, str] = {}
+    batch: list[str] = []
+    last_flush = time.monotonic()
+    while True:
+        ready, _, _ = select.select([fd], [], [], FFMPEG_LOG_FLUSH_SECONDS)
+        if ready:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            *lines, partial = (partial + decoder.decode(chunk)).split("\n")
+            batch.extend(
+                prefix + line
+                for line in summarize_ffmpeg_output(lines, progress_fields)
+            )
+
+        if batch and (
+            len(batch) >= FFMPEG_LOG_BATCH_LINES
+            or time.monotonic() - last_flush >= FFMPEG_LOG_FLUSH_SECONDS
+        ):
+            console.print("\n".join(batch), markup=False)
+            batch.clear()
+            last_flush = time.monotonic()
+
+    partial += decoder.decode(b"", final=True)
+    batch.extend(
+        prefix + line for line in summarize_ffmpeg_output([partial], progress_fields)
+    )
+    if batch:
+        console.print("\n".join(batch), markup=False)
+    process.stderr.close()
 
     return process.wait()
 
 
-def convert_mov_files(episode_groups: list[EpisodeGroup], dry_run: bool = False) -> int:
+def collect_mov_files(episode_groups: list[EpisodeGroup]) -> list[Path]:
     mov_files: list[Path] = []
     for group in episode_groups:
         for file in group.files:
-            if file.path.suffix.lower() == ".mov":
+            # Compare the name's tail directly; scanning already skips
+            # dotfiles, so a bare ".mov" name can't show up here.
+            if file.path.name[-4:].lower() == ".mov":
                 mov_files.append(file.path)
+    return mov_files
 
-    if not mov_files:
-        console.print("No .mov files found for conversion.")
-        return 0
 
-    if shutil.which("ffmpeg") is None:
+@lru_cache(maxsize=1)
+def ffmpeg_path() -> str | None:
+    # Resolved once per process; both the availability check and every
+    # conversion reuse it instead of walking PATH again.
+    return shutil.which("ffmpeg")
+
+
+def ffmpeg_available() -> bool:
+    if ffmpeg_path() is None:
         console.print("ffmpeg is not available on PATH.", style="bold red")
-        return 1
+        return False
+    return True
+
 
+def plan_mov_conversions(
+    mov_files: list[Path], dry_run: bool = False
+) -> list[tuple[Path, Path]]:
+    conversions: list[tuple[Path, Path]] = []
+    for mov_file in mov_files:
+        output_path = mov_file.with_name(f"{mov_file.stem}_HQ.mp4")
+        console.print(f"\nConverting: {mov_file} -> {output_path}", style="bold")
+
+        if dry_run:
+            continue
+
+        if output_path.exists():
+            console.print(f"Skipping existing output: {output_path}")
+            continue
+
+        conversions.append((mov_file, output_path))
+    return conversions
+
+
+def ffmpeg_threads_per_job(parallelism: int) -> int:
+    # Split the cores between concurrent ffmpeg processes so the pool doesn't
+    # oversubscribe the CPU with each instance spawning a thread per core.
+    return max(1, (os.cpu_count() or 1) // max(parallelism, 1))
+
+
+def conversion_succeeded(future: Future[int], mov_file: Path) -> bool:
+    try:
+        code = future.result()
+    except Exception as exc:
+        console.print(
+            f"Failed to run ffmpeg for {mov_file}: {exc}", style="red", markup=False
+        )
+        return False
+    return code == 0
+
+
+def print_conversion_failures(failures: list[Path]) -> None:
+    console.print(f"{len(failures)} conversion(s) failed.", style="bold red")
+    for failed in failures:
+        console.print(f"  - {failed}", markup=False)
+
+
+def run_mov_conversions(
+    conversions: list[tuple[Path, Path]],
+    parallelism: int = DEFAULT_FFMPEG_PARALLELISM,
+    hwaccel: bool = True,
+    fragmented: bool = False,
+) -> int:
+    if not conversions:
+        return 0
+
+    threads_per_job = ffmpeg_threads_per_job(parallelism)
     failures: list[Path] = []
     with Progress(
         SpinnerColumn(),
@@ -421,33 +955,56 @@ def convert_mov_files(episode_groups: list[EpisodeGroup], dry_run: bool = False)
         console=console,
     ) as progress:
         convert_task = progress.add_task(
-            "Converting .mov to _HQ.mp4", total=len(mov_files)
+            "Converting .mov to _HQ.mp4", total=len(conversions)
         )
 
-        for mov_file in mov_files:
-            output_path = mov_file.with_name(f"{mov_file.stem}_HQ.mp4")
-            progress.console.print(
-                f"\nConverting: {mov_file} -> {output_path}", style="bold"
-            )
+        with ThreadPoolExecutor(
+            max_workers=min(max(parallelism, 1), len(conversions))
+        ) as executor:
+            future_map = {
+                executor.submit(
+                    stream_ffmpeg,
+                    mov_file,
+                    output_path,
+                    threads_per_job,
+                    hwaccel,
+                    fragmented,
+                ): mov_file
+                for mov_file, output_path in conversions
+            }
 
-            if dry_run:
+            for future in as_completed(future_map):
+                mov_file = future_map[future]
+                if not conversion_succeeded(future, mov_file):
+                    failures.append(mov_file)
                 progress.advance(convert_task)
-                continue
-
-            if output_path.exists():
-                progress.console.print(f"Skipping existing output: {output_path}")
-                progress.advance(convert_task)
-                continue
-
-            code = stream_ffmpeg(mov_file, output_path)
-            if code != 0:
-                failures.append(mov_file)
-            progress.advance(convert_task)
 
     if failures:
-        console.print(f"{len(failures)} conversion(s) failed.", style="bold red")
-        for failed in failures:
-            console.print(f"  - {failed}", markup=False)
+        print_conversion_failures(failures)
         return 1
 
     return 0
+
+
+def convert_mov_files(
+    episode_groups: list[EpisodeGroup],
+    dry_run: bool = False,
+    parallelism: int = DEFAULT_FFMPEG_PARALLELISM,
+    hwaccel: bool = True,
+    fragmented: bool = False,
+) -> int:
+    mov_files = collect_mov_files(episode_groups)
+    if not mov_files:
+        console.print("No .mov files found for conversion.")
+        return 0
+
+    if not ffmpeg_available():
+        return 1
+
+    conversions = plan_mov_conversions(mov_files, dry_run=dry_run)
+    return run_mov_conversions(
+        conversions,
+        parallelism=parallelism,
+        hwaccel=hwaccel,
+        fragmented=fragmented,
+    )